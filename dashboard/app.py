@@ -8,14 +8,20 @@ financial inclusion indicators.
 """
 
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from datetime import datetime
+import math
 import os
 
+from chart_data import (
+    TRANSACTION_DATA, ACC_DATA, MM_DATA, INFRA_DATA, GENDER_DATA,
+    ACC_FORECAST, DP_FORECAST, FORECAST_SUMMARY,
+    SCENARIO_YEARS, SCENARIOS, SCENARIO_BY_NAME, GAUGE_BAR,
+    KEY_QUESTIONS
+)
+
 # Page configuration
 st.set_page_config(
     page_title="Ethiopia Financial Inclusion Dashboard",
@@ -50,46 +56,287 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Data loading functions
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data/processed')
+
+DATASETS = [
+    'ethiopia_fi_unified_data_enriched',
+    'forecast_2025_2027',
+    'event_indicator_matrix_refined',
+    'observations',
+    'events',
+    'observations_pct',
+    'observations_full',
+]
+
+# Datasets are held with st.cache_resource: one shared, read-only frame per
+# process instead of a pickled copy per call. Page code must not mutate them.
+# One entry per dataset, so a frame superseded by a re-run of the conversion
+# script is evicted rather than kept alive until the process exits.
+@st.cache_resource(max_entries=len(DATASETS))
+def load_parquet(path, mtime):
+    """Read one processed dataset, cached on its path and modification time rather than its contents"""
+    return pd.read_parquet(path, engine='pyarrow', memory_map=True)
+
+def dataset_path(name):
+    """Path of a dataset written by scripts/convert_to_parquet.py"""
+    return os.path.join(DATA_PATH, f'{name}.parquet')
+
+def dataset_version(name):
+    """Modification time of one dataset, used as its cache key"""
+    return os.path.getmtime(dataset_path(name))
+
+def stop_with_load_error(error):
+    """Show the data loading error banner and end the page there"""
+    st.error(f"Error loading data: {error}")
+    render_footer()
+    st.stop()
+
+# The startup check only confirms the files exist, so reads that fail
+# (e.g. a corrupt Parquet file) are reported here with the same banner
+def load_dataset(name):
+    """Load a dataset written by scripts/convert_to_parquet.py"""
+    try:
+        return load_parquet(dataset_path(name), dataset_version(name))
+    except Exception as e:
+        stop_with_load_error(e)
+
+# Lazy accessors, so each page only loads the datasets it uses
+def get_main_data():
+    """Main enriched data"""
+    return load_dataset('ethiopia_fi_unified_data_enriched')
+
+def get_observations():
+    """Observations, pre-split with a parsed year at ingest"""
+    return load_dataset('observations')
+
+def get_events():
+    """Events, pre-split with a parsed year at ingest"""
+    return load_dataset('events')
+
+def get_observations_pct():
+    """Percentage-unit observations charted on the Trends page"""
+    return load_dataset('observations_pct')
+
+@st.cache_data(max_entries=len(DATASETS))
+def serialize_csv(path, mtime):
+    """CSV bytes of one processed dataset, cached on the same key as load_parquet"""
+    return load_parquet(path, mtime).to_csv(index=False).encode('utf-8')
+
+def dataset_csv_bytes(name):
+    """CSV download of a dataset written by scripts/convert_to_parquet.py"""
+    try:
+        return serialize_csv(dataset_path(name), dataset_version(name))
+    except Exception as e:
+        stop_with_load_error(e)
+
+@st.cache_data(max_entries=len(DATASETS))
+def read_file_bytes(path, mtime):
+    """Raw bytes of one processed dataset file, cached on the same key as load_parquet"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def dataset_parquet_bytes(name):
+    """Parquet download of a dataset, served as the file the conversion script wrote"""
+    return read_file_bytes(dataset_path(name), dataset_version(name))
+
+def get_data_version():
+    """Modification time of the processed data, used as a cheap cache key for derived results"""
+    return dataset_version('ethiopia_fi_unified_data_enriched')
+
+# Derived results are keyed on a dataset modification time (data_version,
+# or the version of the one dataset they read); the leading underscore
+# tells Streamlit not to hash the DataFrame argument itself
+@st.cache_data
+def compute_overview_metrics(_observations, data_version):
+    """Compute the Overview page's scalar metrics"""
+    acc_ownership = _observations[
+        (_observations['indicator_code'] == 'ACC_OWNERSHIP') & 
+        (_observations['gender'] == 'all')
+    ].sort_values('year')
+    return {
+        'acc_current': acc_ownership['value_numeric'].iloc[-1] if len(acc_ownership) > 0 else 49.0,
+        'acc_prev': acc_ownership['value_numeric'].iloc[-2] if len(acc_ownership) > 1 else 46.0,
+    }
+
+@st.cache_data
+def compute_overview_summary(_main_data, _observations, _events, data_version):
+    """Compute the Overview page's record counts"""
+    return {
+        'record_counts': _main_data['record_type'].value_counts(),
+        'n_total': len(_main_data),
+        'n_observations': len(_observations),
+        'n_events': len(_events),
+    }
+
+@st.cache_data
+def compute_top_events(_events, data_version, n=8):
+    """Most recent events for the Overview timeline table"""
+    events_summary = _events[['indicator', 'year']].dropna()
+    return events_summary.sort_values('year', ascending=False).head(n)
+
+@st.cache_data
+def compute_trend_data(_observations_pct, observations_pct_version, year_range, pillars):
+    """Mean percentage value per indicator and year for the selected filters"""
+    # Filter percentage observations by selected pillars and year range;
+    # year is nullable Int16, so missing years are treated as out of range
+    mask = np.logical_and.reduce([
+        _observations_pct['pillar'].isin(pillars).to_numpy(),
+        _observations_pct['year'].between(year_range[0], year_range[1], inclusive='both')
+            .to_numpy(dtype=bool, na_value=False),
+    ])
+    filtered_obs = _observations_pct[mask]
+    # Observations are stored sorted by indicator and year, so sort=False
+    # keeps each line's points in year order; observed=True skips the empty
+    # categorical combinations
+    return filtered_obs.groupby(
+        ['indicator_code', 'year', 'pillar'], observed=True, sort=False, as_index=False
+    )['value_numeric'].mean()
+
+# Figure builders
+def gauge_point(value, radius):
+    """SVG coordinates of a 0-100 gauge value on an arc of the given radius"""
+    angle = math.pi * (1 - value / 100)
+    return 200 + radius * math.cos(angle), 210 - radius * math.sin(angle)
+
+def gauge_arc(start, end, color, width, radius=150):
+    """SVG arc covering a 0-100 gauge range"""
+    x0, y0 = gauge_point(start, radius)
+    x1, y1 = gauge_point(end, radius)
+    return (f'<path d="M {x0:.1f} {y0:.1f} A {radius} {radius} 0 0 1 {x1:.1f} {y1:.1f}" '
+            f'fill="none" stroke="{color}" stroke-width="{width}"/>')
+
 @st.cache_data
-def load_data():
-    """Load all required datasets"""
-    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+def build_gauge_svg(selected_scenario, value, color, target=70.0):
+    """2025 projection gauge as inline SVG, in place of a Plotly indicator"""
+    # Bands, the value bar and the target line, drawn as arcs and a line
+    # so the gauge needs no Plotly figure
+    bands = [(0, 49, "#fadbd8"), (49, 70, "#fdebd0"), (70, 100, "#d5f5e3")]
+    shapes = [gauge_arc(start, end, band_color, 60) for start, end, band_color in bands]
+    shapes.append(gauge_arc(0, value, color, 22))
+    (tx0, ty0), (tx1, ty1) = gauge_point(target, 112), gauge_point(target, 188)
+    shapes.append(f'<line x1="{tx0:.1f}" y1="{ty0:.1f}" x2="{tx1:.1f}" y2="{ty1:.1f}" stroke="red" stroke-width="4"/>')
+    
+    # Axis ticks, on a radius that keeps the end labels inside the viewBox
+    for tick in range(0, 101, 20):
+        x, y = gauge_point(tick, 185)
+        shapes.append(f'<text x="{x:.1f}" y="{y:.1f}" font-size="12" fill="#444" text-anchor="middle">{tick}</text>')
     
-    # Load main enriched data
-    main_data = pd.read_csv(os.path.join(base_path, 'data/processed/ethiopia_fi_unified_data_enriched.csv'))
+    # Number and delta against the target
+    delta = value - target
+    delta_color, arrow = ("#3d9970", "▲") if delta >= 0 else ("#ff4136", "▼")
+    return (
+        '<div style="text-align: center;">'
+        '<div style="font-size: 1.1rem;">2025 Account Ownership Projection</div>'
+        f'<div style="font-size: 0.9rem; color: gray;">{selected_scenario}</div>'
+        '<svg viewBox="0 0 400 300" width="100%" height="300" role="img">'
+        + ''.join(shapes) +
+        f'<text x="200" y="205" font-size="48" text-anchor="middle" fill="#2c3e50">{value:.1f}</text>'
+        f'<text x="200" y="250" font-size="20" text-anchor="middle" fill="{delta_color}">{arrow}{abs(delta):.1f}</text>'
+        '</svg></div>'
+    )
+
+def build_comparison_base():
+    """Target line and layout of the scenario comparison chart"""
+    import plotly.graph_objects as go
     
-    # Load forecast data
-    forecast_data = pd.read_csv(os.path.join(base_path, 'data/processed/forecast_2025_2027.csv'))
+    fig = go.Figure()
     
-    # Load impact matrix
-    impact_matrix = pd.read_csv(os.path.join(base_path, 'data/processed/event_indicator_matrix_refined.csv'))
+    # Target line
+    fig.add_hline(y=70, line_dash="dash", line_color="purple",
+                  annotation_text="NFIS-II Target (70%)")
     
-    return main_data, forecast_data, impact_matrix
+    fig.update_layout(
+        xaxis_title='Year',
+        yaxis_title='Account Ownership (%)',
+        yaxis_range=[0, 100],
+        height=500,
+        legend=dict(orientation='h', yanchor='bottom', y=1.02)
+    )
+    return fig
+
+def build_scenario_comparison(selected_scenario):
+    """Scenario comparison chart highlighting the selected scenario"""
+    import plotly.graph_objects as go
+    
+    scenario = SCENARIO_BY_NAME[selected_scenario]
+    
+    fig_scenarios = build_comparison_base()
+    
+    # History and the unselected scenarios share one grey context
+    # trace, with NaN breaking it into segments; only the selected
+    # scenario gets its own highlighted trace. Coordinates are float32
+    # arrays rather than Python lists to keep the payload small.
+    gap = np.array([np.nan], dtype=np.float32)
+    history_x = ACC_DATA['Year'].to_numpy(dtype=np.float32)
+    history_y = ACC_DATA['Account Ownership (%)'].to_numpy(dtype=np.float32)
+    context_x = [history_x]
+    context_y = [history_y]
+    context_text = ['Historical'] * len(ACC_DATA)
+    for other in SCENARIOS:
+        if other is scenario:
+            continue
+        context_x += [gap, SCENARIO_YEARS]
+        context_y += [gap, other.values]
+        context_text += [None] + [other.name] * len(SCENARIO_YEARS)
+    context_x = np.concatenate(context_x)
+    context_y = np.concatenate(context_y)
+    
+    # Both traces go in one add_traces call, so the figure is validated
+    # once rather than per trace
+    fig_scenarios.add_traces([
+        go.Scattergl(
+            x=context_x,
+            y=context_y,
+            text=context_text,
+            name='Historical & other scenarios',
+            mode='lines+markers',
+            line=dict(color='#95a5a6', width=2),
+            marker=dict(size=6),
+            hovertemplate='%{text}: %{y:.1f}%<extra></extra>'
+        ),
+        # Selected scenario, joined to the last historical point; the
+        # other scenarios start at 2025 without a connector
+        go.Scattergl(
+            x=np.concatenate((history_x[-1:], SCENARIO_YEARS)),
+            y=np.concatenate((history_y[-1:], scenario.values)),
+            name=selected_scenario,
+            mode='lines+markers',
+            line=dict(color=scenario.color, width=3),
+            marker=dict(size=8),
+            hovertemplate=selected_scenario + ': %{y:.1f}%<extra></extra>'
+        ),
+    ])
+    return fig_scenarios
 
 @st.cache_data
-def process_observations(main_data):
-    """Extract and process observations"""
-    obs = main_data[main_data['record_type'] == 'observation'].copy()
-    obs['year'] = pd.to_datetime(obs['observation_date'], format='mixed', errors='coerce').dt.year
-    return obs
-
-@st.cache_data  
-def process_events(main_data):
-    """Extract and process events"""
-    events = main_data[main_data['record_type'] == 'event'].copy()
-    events['year'] = pd.to_datetime(events['observation_date'], format='mixed', errors='coerce').dt.year
-    return events
-
-# Load data
+def scenario_comparison_html(selected_scenario):
+    """Scenario comparison chart as an HTML snippet, rendered once per scenario"""
+    import plotly.io as pio
+    
+    fig = build_scenario_comparison(selected_scenario)
+    return pio.to_html(fig, include_plotlyjs='cdn', full_html=False, default_width='100%')
+
+# Check data availability; pages load the datasets they need on demand
 try:
-    main_data, forecast_data, impact_matrix = load_data()
-    observations = process_observations(main_data)
-    events = process_events(main_data)
+    for name in DATASETS:
+        if not os.path.exists(dataset_path(name)):
+            raise FileNotFoundError(f"{dataset_path(name)} not found, run scripts/convert_to_parquet.py")
+    data_version = get_data_version()
     data_loaded = True
 except Exception as e:
     st.error(f"Error loading data: {e}")
     data_loaded = False
 
+def render_footer():
+    """Dashboard footer, shared by pages that stop early"""
+    st.markdown("---")
+    st.markdown(
+        "<div style='text-align: center; color: gray;'>"
+        "Ethiopia Financial Inclusion Forecasting Dashboard | Selam Analytics | February 2026"
+        "</div>",
+        unsafe_allow_html=True
+    )
+
 # Sidebar navigation
 st.sidebar.image("https://img.icons8.com/color/96/000000/ethiopia.png", width=80)
 st.sidebar.title("🇪🇹 Ethiopia FI Dashboard")
@@ -116,21 +363,25 @@ st.sidebar.markdown("*February 2026*")
 # PAGE 1: OVERVIEW
 # ============================================================================
 if page == "📊 Overview":
+    # Plotly is imported per page so its import cost stays off pages that don't chart
+    import plotly.express as px
+    
     st.markdown('<h1 class="main-header">📊 Ethiopia Financial Inclusion Overview</h1>', unsafe_allow_html=True)
     
     if data_loaded:
+        main_data = get_main_data()
+        observations = get_observations()
+        events = get_events()
+        
         # Key Metrics Row
         st.subheader("Key Metrics (2024)")
         
         col1, col2, col3, col4 = st.columns(4)
         
         # Account Ownership
-        acc_ownership = observations[
-            (observations['indicator_code'] == 'ACC_OWNERSHIP') & 
-            (observations['gender'] == 'all')
-        ].sort_values('year')
-        current_acc = acc_ownership['value_numeric'].iloc[-1] if len(acc_ownership) > 0 else 49.0
-        prev_acc = acc_ownership['value_numeric'].iloc[-2] if len(acc_ownership) > 1 else 46.0
+        metrics = compute_overview_metrics(observations, data_version)
+        current_acc = metrics['acc_current']
+        prev_acc = metrics['acc_prev']
         
         with col1:
             st.metric(
@@ -210,14 +461,8 @@ if page == "📊 Overview":
             # P2P vs ATM Transactions Chart
             st.markdown("#### P2P vs ATM Transactions (FY2024/25)")
             
-            transaction_data = pd.DataFrame({
-                'Channel': ['P2P Digital', 'ATM Withdrawals'],
-                'Transactions (M)': [128.3, 119.3],
-                'YoY Growth': ['+158%', '+26%']
-            })
-            
             fig_txn = px.bar(
-                transaction_data, 
+                TRANSACTION_DATA, 
                 x='Channel', 
                 y='Transactions (M)',
                 color='Channel',
@@ -232,13 +477,8 @@ if page == "📊 Overview":
             # Account Ownership Trajectory
             st.markdown("#### Account Ownership Trajectory")
             
-            acc_data = pd.DataFrame({
-                'Year': [2011, 2014, 2017, 2021, 2024],
-                'Account Ownership (%)': [14, 22, 35, 46, 49]
-            })
-            
             fig_acc = px.line(
-                acc_data, 
+                ACC_DATA, 
                 x='Year', 
                 y='Account Ownership (%)',
                 markers=True,
@@ -258,20 +498,19 @@ if page == "📊 Overview":
         
         with col_a:
             st.markdown("**Record Types**")
-            record_counts = main_data['record_type'].value_counts()
-            st.dataframe(record_counts, use_container_width=True)
+            summary = compute_overview_summary(main_data, observations, events, data_version)
+            st.dataframe(summary['record_counts'], use_container_width=True)
         
         with col_b:
             st.markdown("**Events Timeline**")
-            events_summary = events[['indicator', 'year']].dropna()
-            events_summary = events_summary.sort_values('year', ascending=False).head(8)
+            events_summary = compute_top_events(events, data_version)
             st.dataframe(events_summary, use_container_width=True, hide_index=True)
         
         with col_c:
             st.markdown("**Data Coverage**")
-            st.write(f"• Total Records: {len(main_data)}")
-            st.write(f"• Observations: {len(observations)}")
-            st.write(f"• Events: {len(events)}")
+            st.write(f"• Total Records: {summary['n_total']}")
+            st.write(f"• Observations: {summary['n_observations']}")
+            st.write(f"• Events: {summary['n_events']}")
             st.write(f"• Temporal Range: 2011-2025")
             st.write(f"• Pillars: ACCESS, USAGE, GENDER, AFFORDABILITY")
 
@@ -279,57 +518,71 @@ if page == "📊 Overview":
 # PAGE 2: TRENDS
 # ============================================================================
 elif page == "📈 Trends":
+    import plotly.express as px
+    import plotly.graph_objects as go
+    from plotly_resampler import FigureResampler
+    
     st.markdown('<h1 class="main-header">📈 Trend Analysis</h1>', unsafe_allow_html=True)
     
     if data_loaded:
-        # Date range selector
-        st.sidebar.markdown("### Filters")
-        year_range = st.sidebar.slider(
-            "Select Year Range",
-            min_value=2011,
-            max_value=2027,
-            value=(2011, 2025)
-        )
-        
-        # Pillar selector
-        selected_pillars = st.sidebar.multiselect(
-            "Select Pillars",
-            options=['ACCESS', 'USAGE', 'GENDER', 'AFFORDABILITY'],
-            default=['ACCESS', 'USAGE']
-        )
-        
-        # Interactive Time Series Plot
-        st.subheader("📊 Financial Inclusion Indicators Over Time")
-        
-        # Filter observations by selected pillars
-        filtered_obs = observations[
-            (observations['pillar'].isin(selected_pillars)) &
-            (observations['year'] >= year_range[0]) &
-            (observations['year'] <= year_range[1]) &
-            (observations['unit'] == '%')
-        ]
-        
-        if len(filtered_obs) > 0:
-            # Group by indicator and year
-            trend_data = filtered_obs.groupby(['indicator_code', 'year', 'pillar'])['value_numeric'].mean().reset_index()
+        observations_pct = get_observations_pct()
+        
+        # Widgets and the charts they drive live in fragments on each page,
+        # so changing a widget reruns only that section. Fragments cannot
+        # write to the sidebar, so the widgets sit in the page body.
+        @st.fragment
+        def render_indicator_trends():
+            """Filterable indicator time series"""
+            # Interactive Time Series Plot
+            st.subheader("📊 Financial Inclusion Indicators Over Time")
             
-            fig_trends = px.line(
-                trend_data,
-                x='year',
-                y='value_numeric',
-                color='indicator_code',
-                markers=True,
-                title='Indicator Trends by Year'
-            )
-            fig_trends.update_layout(
-                xaxis_title='Year',
-                yaxis_title='Value (%)',
-                legend_title='Indicator',
-                height=500
+            col_years, col_pillars = st.columns(2)
+            
+            # Date range selector
+            with col_years:
+                year_range = st.slider(
+                    "Select Year Range",
+                    min_value=2011,
+                    max_value=2027,
+                    value=(2011, 2025)
+                )
+            
+            # Pillar selector
+            with col_pillars:
+                selected_pillars = st.multiselect(
+                    "Select Pillars",
+                    options=['ACCESS', 'USAGE', 'GENDER', 'AFFORDABILITY'],
+                    default=['ACCESS', 'USAGE']
+                )
+            
+            trend_data = compute_trend_data(
+                observations_pct, dataset_version('observations_pct'), year_range, tuple(selected_pillars)
             )
-            st.plotly_chart(fig_trends, use_container_width=True)
-        else:
-            st.info("No data available for selected filters. Try adjusting the year range or pillars.")
+            
+            if len(trend_data) > 0:
+                fig_trends = px.line(
+                    trend_data,
+                    x='year',
+                    y='value_numeric',
+                    color='indicator_code',
+                    markers=True,
+                    render_mode='webgl',
+                    title='Indicator Trends by Year'
+                )
+                fig_trends.update_layout(
+                    xaxis_title='Year',
+                    yaxis_title='Value (%)',
+                    legend_title='Indicator',
+                    height=500
+                )
+                # Downsample server-side so the browser never receives more than
+                # 2000 points per trace, however long the series grow
+                fig_trends = FigureResampler(fig_trends, default_n_shown_samples=2000)
+                st.plotly_chart(fig_trends, use_container_width=True)
+            else:
+                st.info("No data available for selected filters. Try adjusting the year range or pillars.")
+        
+        render_indicator_trends()
         
         st.markdown("---")
         
@@ -340,14 +593,8 @@ elif page == "📈 Trends":
         
         with col1:
             # Mobile Money User Growth
-            mm_data = pd.DataFrame({
-                'Provider': ['Telebirr', 'M-Pesa', 'CBE Birr'],
-                'Users (M)': [54.8, 10.8, 2.5],
-                'Launch Year': [2021, 2023, 2017]
-            })
-            
             fig_mm = px.bar(
-                mm_data,
+                MM_DATA,
                 x='Provider',
                 y='Users (M)',
                 color='Provider',
@@ -364,27 +611,21 @@ elif page == "📈 Trends":
         
         with col2:
             # Infrastructure Growth
-            infra_data = pd.DataFrame({
-                'Year': ['2023', '2025'],
-                '4G Coverage (%)': [37.5, 70.8],
-                'Smartphone Penetration (%)': [20, 24]
-            })
-            
             fig_infra = go.Figure()
             fig_infra.add_trace(go.Bar(
                 name='4G Coverage',
-                x=infra_data['Year'],
-                y=infra_data['4G Coverage (%)'],
+                x=INFRA_DATA['Year'],
+                y=INFRA_DATA['4G Coverage (%)'],
                 marker_color='#3498db',
-                text=infra_data['4G Coverage (%)'].apply(lambda x: f'{x}%'),
+                text=INFRA_DATA['4G Coverage (%)'].apply(lambda x: f'{x}%'),
                 textposition='outside'
             ))
             fig_infra.add_trace(go.Bar(
                 name='Smartphone Penetration',
-                x=infra_data['Year'],
-                y=infra_data['Smartphone Penetration (%)'],
+                x=INFRA_DATA['Year'],
+                y=INFRA_DATA['Smartphone Penetration (%)'],
                 marker_color='#9b59b6',
-                text=infra_data['Smartphone Penetration (%)'].apply(lambda x: f'{x}%'),
+                text=INFRA_DATA['Smartphone Penetration (%)'].apply(lambda x: f'{x}%'),
                 textposition='outside'
             ))
             fig_infra.update_layout(
@@ -399,28 +640,21 @@ elif page == "📈 Trends":
         # Gender Gap Analysis
         st.subheader("👥 Gender Gap in Financial Inclusion")
         
-        gender_data = pd.DataFrame({
-            'Year': [2017, 2021, 2024],
-            'Male': [40, 56, 58],
-            'Female': [30, 36, 38],
-            'Gap': [10, 20, 20]
-        })
-        
         fig_gender = go.Figure()
-        fig_gender.add_trace(go.Scatter(
-            x=gender_data['Year'], y=gender_data['Male'],
+        fig_gender.add_trace(go.Scattergl(
+            x=GENDER_DATA['Year'], y=GENDER_DATA['Male'],
             name='Male', mode='lines+markers',
             line=dict(color='#3498db', width=3),
             marker=dict(size=10)
         ))
-        fig_gender.add_trace(go.Scatter(
-            x=gender_data['Year'], y=gender_data['Female'],
+        fig_gender.add_trace(go.Scattergl(
+            x=GENDER_DATA['Year'], y=GENDER_DATA['Female'],
             name='Female', mode='lines+markers',
             line=dict(color='#e74c3c', width=3),
             marker=dict(size=10)
         ))
         fig_gender.add_trace(go.Bar(
-            x=gender_data['Year'], y=gender_data['Gap'],
+            x=GENDER_DATA['Year'], y=GENDER_DATA['Gap'],
             name='Gender Gap',
             marker_color='rgba(155, 89, 182, 0.5)',
             yaxis='y2'
@@ -439,179 +673,172 @@ elif page == "📈 Trends":
         st.markdown("---")
         st.subheader("📥 Download Data")
         
-        csv = observations.to_csv(index=False)
-        st.download_button(
-            label="Download Observations CSV",
-            data=csv,
-            file_name="ethiopia_fi_observations.csv",
-            mime="text/csv"
-        )
+        col_csv, col_parquet = st.columns(2)
+        
+        with col_csv:
+            st.download_button(
+                label="Download Observations CSV",
+                data=dataset_csv_bytes('observations_full'),
+                file_name="ethiopia_fi_observations.csv",
+                mime="text/csv"
+            )
+        
+        with col_parquet:
+            st.download_button(
+                label="Download Observations Parquet",
+                data=dataset_parquet_bytes('observations_full'),
+                file_name="ethiopia_fi_observations.parquet",
+                mime="application/octet-stream"
+            )
 
 # ============================================================================
 # PAGE 3: FORECASTS
 # ============================================================================
 elif page == "🔮 Forecasts":
+    import plotly.graph_objects as go
+    
     st.markdown('<h1 class="main-header">🔮 Forecasts (2025-2027)</h1>', unsafe_allow_html=True)
     
     if data_loaded:
-        # Model selection
-        st.sidebar.markdown("### Forecast Settings")
-        model_type = st.sidebar.selectbox(
-            "Select Model",
-            ["Event-Augmented (Recommended)", "Linear Trend Only"]
-        )
-        
-        show_ci = st.sidebar.checkbox("Show Confidence Intervals", value=True)
-        
-        # Forecast data
-        acc_forecast = pd.DataFrame({
-            'Year': [2024, 2025, 2026, 2027],
-            'Account Ownership (%)': [49.0, 61.8, 73.7, 82.5],
-            'Trend Only': [49.0, 54.8, 57.7, 60.5],
-            'CI Lower': [49.0, 42.9, 53.9, 61.9],
-            'CI Upper': [49.0, 80.8, 93.4, 103.1],
-            'Pessimistic': [49.0, 57.8, 64.7, 70.0],
-            'Optimistic': [49.0, 64.4, 79.5, 90.6]
-        })
-        
-        dp_forecast = pd.DataFrame({
-            'Year': [2024, 2025, 2026, 2027],
-            'Digital Payment (%)': [42.0, 59.6, 82.9, 100.0],  # Capped at 100
-            'Trend Only': [42.0, 48.6, 52.9, 57.3],
-            'CI Lower': [42.0, 35.8, 59.1, 79.1],
-            'CI Upper': [42.0, 83.4, 100.0, 100.0],  # Capped
-            'Pessimistic': [42.0, 53.3, 66.4, 79.1],
-            'Optimistic': [42.0, 63.6, 93.4, 100.0]  # Capped
-        })
-        
-        # Forecast Visualizations
-        st.subheader("📊 Account Ownership Forecast")
-        
-        fig_acc_fc = go.Figure()
-        
-        # Historical data
-        fig_acc_fc.add_trace(go.Scatter(
-            x=[2011, 2014, 2017, 2021, 2024],
-            y=[14, 22, 35, 46, 49],
-            name='Historical',
-            mode='lines+markers',
-            line=dict(color='#2c3e50', width=2),
-            marker=dict(size=10)
-        ))
-        
-        if model_type == "Event-Augmented (Recommended)":
-            # Base forecast
-            fig_acc_fc.add_trace(go.Scatter(
-                x=acc_forecast['Year'],
-                y=acc_forecast['Account Ownership (%)'],
-                name='Base Scenario',
-                mode='lines+markers',
-                line=dict(color='#27ae60', width=3),
-                marker=dict(size=12)
-            ))
+        # Model settings and forecast charts rerun as one fragment
+        @st.fragment
+        def render_forecast_charts():
+            """Forecast settings and the ACCESS/USAGE forecast charts"""
+            # Model selection
+            st.markdown("### Forecast Settings")
+            col_model, col_ci = st.columns(2)
             
-            if show_ci:
-                # Confidence interval
-                fig_acc_fc.add_trace(go.Scatter(
-                    x=list(acc_forecast['Year']) + list(acc_forecast['Year'][::-1]),
-                    y=list(acc_forecast['CI Upper']) + list(acc_forecast['CI Lower'][::-1]),
-                    fill='toself',
-                    fillcolor='rgba(39, 174, 96, 0.2)',
-                    line=dict(color='rgba(255,255,255,0)'),
-                    name='95% CI'
-                ))
-        else:
-            # Trend only
-            fig_acc_fc.add_trace(go.Scatter(
-                x=acc_forecast['Year'],
-                y=acc_forecast['Trend Only'],
-                name='Linear Trend',
+            with col_model:
+                model_type = st.selectbox(
+                    "Select Model",
+                    ["Event-Augmented (Recommended)", "Linear Trend Only"]
+                )
+            
+            with col_ci:
+                show_ci = st.checkbox("Show Confidence Intervals", value=True)
+            
+            # Forecast Visualizations
+            st.subheader("📊 Account Ownership Forecast")
+            
+            fig_acc_fc = go.Figure()
+            
+            # Historical data
+            fig_acc_fc.add_trace(go.Scattergl(
+                x=[2011, 2014, 2017, 2021, 2024],
+                y=[14, 22, 35, 46, 49],
+                name='Historical',
                 mode='lines+markers',
-                line=dict(color='#7f8c8d', width=2, dash='dash'),
+                line=dict(color='#2c3e50', width=2),
                 marker=dict(size=10)
             ))
-        
-        # NFIS-II Target
-        fig_acc_fc.add_hline(y=70, line_dash="dash", line_color="red",
-                           annotation_text="NFIS-II Target (70%)")
-        
-        fig_acc_fc.update_layout(
-            xaxis_title='Year',
-            yaxis_title='Account Ownership (%)',
-            yaxis_range=[0, 110],
-            height=500,
-            legend=dict(orientation='h', yanchor='bottom', y=1.02)
-        )
-        st.plotly_chart(fig_acc_fc, use_container_width=True)
-        
-        st.markdown("---")
-        
-        st.subheader("💳 Digital Payment Usage Forecast")
-        
-        fig_dp_fc = go.Figure()
-        
-        # Historical data
-        fig_dp_fc.add_trace(go.Scatter(
-            x=[2017, 2021, 2024],
-            y=[12, 35, 42],
-            name='Historical/Estimated',
-            mode='lines+markers',
-            line=dict(color='#2c3e50', width=2),
-            marker=dict(size=10)
-        ))
-        
-        if model_type == "Event-Augmented (Recommended)":
-            fig_dp_fc.add_trace(go.Scatter(
-                x=dp_forecast['Year'],
-                y=dp_forecast['Digital Payment (%)'],
-                name='Base Scenario',
-                mode='lines+markers',
-                line=dict(color='#3498db', width=3),
-                marker=dict(size=12)
-            ))
             
-            if show_ci:
-                fig_dp_fc.add_trace(go.Scatter(
-                    x=list(dp_forecast['Year']) + list(dp_forecast['Year'][::-1]),
-                    y=list(dp_forecast['CI Upper']) + list(dp_forecast['CI Lower'][::-1]),
-                    fill='toself',
-                    fillcolor='rgba(52, 152, 219, 0.2)',
-                    line=dict(color='rgba(255,255,255,0)'),
-                    name='95% CI'
+            if model_type == "Event-Augmented (Recommended)":
+                # Base forecast
+                fig_acc_fc.add_trace(go.Scattergl(
+                    x=ACC_FORECAST['Year'],
+                    y=ACC_FORECAST['Account Ownership (%)'],
+                    name='Base Scenario',
+                    mode='lines+markers',
+                    line=dict(color='#27ae60', width=3),
+                    marker=dict(size=12)
+                ))
+                
+                if show_ci:
+                    # Confidence interval
+                    fig_acc_fc.add_trace(go.Scatter(
+                        x=list(ACC_FORECAST['Year']) + list(ACC_FORECAST['Year'][::-1]),
+                        y=list(ACC_FORECAST['CI Upper']) + list(ACC_FORECAST['CI Lower'][::-1]),
+                        fill='toself',
+                        fillcolor='rgba(39, 174, 96, 0.2)',
+                        line=dict(color='rgba(255,255,255,0)'),
+                        name='95% CI'
+                    ))
+            else:
+                # Trend only
+                fig_acc_fc.add_trace(go.Scattergl(
+                    x=ACC_FORECAST['Year'],
+                    y=ACC_FORECAST['Trend Only'],
+                    name='Linear Trend',
+                    mode='lines+markers',
+                    line=dict(color='#7f8c8d', width=2, dash='dash'),
+                    marker=dict(size=10)
                 ))
-        else:
-            fig_dp_fc.add_trace(go.Scatter(
-                x=dp_forecast['Year'],
-                y=dp_forecast['Trend Only'],
-                name='Linear Trend',
+            
+            # NFIS-II Target
+            fig_acc_fc.add_hline(y=70, line_dash="dash", line_color="red",
+                               annotation_text="NFIS-II Target (70%)")
+            
+            fig_acc_fc.update_layout(
+                xaxis_title='Year',
+                yaxis_title='Account Ownership (%)',
+                yaxis_range=[0, 110],
+                height=500,
+                legend=dict(orientation='h', yanchor='bottom', y=1.02)
+            )
+            st.plotly_chart(fig_acc_fc, use_container_width=True)
+            
+            st.markdown("---")
+            
+            st.subheader("💳 Digital Payment Usage Forecast")
+            
+            fig_dp_fc = go.Figure()
+            
+            # Historical data
+            fig_dp_fc.add_trace(go.Scattergl(
+                x=[2017, 2021, 2024],
+                y=[12, 35, 42],
+                name='Historical/Estimated',
                 mode='lines+markers',
-                line=dict(color='#7f8c8d', width=2, dash='dash'),
+                line=dict(color='#2c3e50', width=2),
                 marker=dict(size=10)
             ))
+            
+            if model_type == "Event-Augmented (Recommended)":
+                fig_dp_fc.add_trace(go.Scattergl(
+                    x=DP_FORECAST['Year'],
+                    y=DP_FORECAST['Digital Payment (%)'],
+                    name='Base Scenario',
+                    mode='lines+markers',
+                    line=dict(color='#3498db', width=3),
+                    marker=dict(size=12)
+                ))
+                
+                if show_ci:
+                    fig_dp_fc.add_trace(go.Scatter(
+                        x=list(DP_FORECAST['Year']) + list(DP_FORECAST['Year'][::-1]),
+                        y=list(DP_FORECAST['CI Upper']) + list(DP_FORECAST['CI Lower'][::-1]),
+                        fill='toself',
+                        fillcolor='rgba(52, 152, 219, 0.2)',
+                        line=dict(color='rgba(255,255,255,0)'),
+                        name='95% CI'
+                    ))
+            else:
+                fig_dp_fc.add_trace(go.Scattergl(
+                    x=DP_FORECAST['Year'],
+                    y=DP_FORECAST['Trend Only'],
+                    name='Linear Trend',
+                    mode='lines+markers',
+                    line=dict(color='#7f8c8d', width=2, dash='dash'),
+                    marker=dict(size=10)
+                ))
+            
+            fig_dp_fc.update_layout(
+                xaxis_title='Year',
+                yaxis_title='Digital Payment Usage (%)',
+                yaxis_range=[0, 110],
+                height=500,
+                legend=dict(orientation='h', yanchor='bottom', y=1.02)
+            )
+            st.plotly_chart(fig_dp_fc, use_container_width=True)
         
-        fig_dp_fc.update_layout(
-            xaxis_title='Year',
-            yaxis_title='Digital Payment Usage (%)',
-            yaxis_range=[0, 110],
-            height=500,
-            legend=dict(orientation='h', yanchor='bottom', y=1.02)
-        )
-        st.plotly_chart(fig_dp_fc, use_container_width=True)
+        render_forecast_charts()
         
         st.markdown("---")
         
         # Forecast Table
         st.subheader("📋 Forecast Summary Table")
         
-        forecast_summary = pd.DataFrame({
-            'Year': [2025, 2026, 2027],
-            'Account Ownership (Base)': ['61.8%', '73.7%', '82.5%'],
-            'ACC Range': ['57.8% - 64.4%', '64.7% - 79.5%', '70.0% - 90.6%'],
-            'Digital Payment (Base)': ['59.6%', '82.9%', '100.0%'],
-            'DP Range': ['53.3% - 63.6%', '66.4% - 93.4%', '79.1% - 100%']
-        })
-        
-        st.dataframe(forecast_summary, use_container_width=True, hide_index=True)
+        st.dataframe(FORECAST_SUMMARY, use_container_width=True, hide_index=True)
         
         # Key Milestones
         st.subheader("🏆 Key Projected Milestones")
@@ -629,10 +856,9 @@ elif page == "🔮 Forecasts":
         
         # Download forecasts
         st.markdown("---")
-        csv_fc = forecast_data.to_csv(index=False)
         st.download_button(
             label="📥 Download Forecast Data CSV",
-            data=csv_fc,
+            data=dataset_csv_bytes('forecast_2025_2027'),
             file_name="ethiopia_fi_forecasts_2025_2027.csv",
             mime="text/csv"
         )
@@ -643,199 +869,83 @@ elif page == "🔮 Forecasts":
 elif page == "🎯 Inclusion Projections":
     st.markdown('<h1 class="main-header">🎯 Financial Inclusion Projections</h1>', unsafe_allow_html=True)
     
-    if data_loaded:
+    # Stop here rather than nesting the page under a data_loaded check
+    if not data_loaded:
+        st.warning("Data not loaded. Run scripts/convert_to_parquet.py and refresh the page.")
+        render_footer()
+        st.stop()
+    
+    # Scenario selector, gauge and comparison chart rerun as one fragment
+    @st.fragment
+    def render_scenario_projection():
+        """Scenario selector, 2025 gauge and scenario comparison chart"""
         # Scenario selector
-        st.sidebar.markdown("### Scenario Settings")
-        selected_scenario = st.sidebar.selectbox(
+        selected_scenario = st.selectbox(
             "Select Scenario",
-            ["Base Case", "Optimistic", "Pessimistic"]
+            list(SCENARIO_BY_NAME)
         )
         
-        # Scenario data
-        scenarios = {
-            'Base Case': {
-                '2025': 61.8, '2026': 73.7, '2027': 82.5,
-                'description': 'Expected event effects materialize as planned'
-            },
-            'Optimistic': {
-                '2025': 64.4, '2026': 79.5, '2027': 90.6,
-                'description': 'Strong execution, synergies realized, accelerated adoption'
-            },
-            'Pessimistic': {
-                '2025': 57.8, '2026': 64.7, '2027': 70.0,
-                'description': 'Economic headwinds, slower adoption, infrastructure delays'
-            }
-        }
-        
-        scenario_data = scenarios[selected_scenario]
+        scenario = SCENARIO_BY_NAME[selected_scenario]
+        value_2025 = float(scenario.values[0])
         
         # Progress toward target visualization
         st.subheader(f"📊 Progress Toward 70% Target ({selected_scenario})")
         
         # Gauge chart for 2025 projection
-        fig_gauge = go.Figure(go.Indicator(
-            mode="gauge+number+delta",
-            value=scenario_data['2025'],
-            delta={'reference': 70, 'relative': False, 'position': "bottom"},
-            title={'text': f"2025 Account Ownership Projection<br><span style='font-size:0.8em;color:gray'>{selected_scenario}</span>"},
-            gauge={
-                'axis': {'range': [0, 100], 'tickwidth': 1},
-                'bar': {'color': "#27ae60" if scenario_data['2025'] >= 60 else "#e74c3c"},
-                'steps': [
-                    {'range': [0, 49], 'color': "#fadbd8"},
-                    {'range': [49, 70], 'color': "#fdebd0"},
-                    {'range': [70, 100], 'color': "#d5f5e3"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 70
-                }
-            }
-        ))
-        fig_gauge.update_layout(height=400)
-        st.plotly_chart(fig_gauge, use_container_width=True)
+        st.markdown(
+            build_gauge_svg(selected_scenario, value_2025, GAUGE_BAR[selected_scenario]),
+            unsafe_allow_html=True
+        )
         
-        st.info(f"**Scenario Description**: {scenario_data['description']}")
+        st.info(f"**Scenario Description**: {scenario.description}")
         
         st.markdown("---")
         
         # All scenarios comparison
         st.subheader("📈 Scenario Comparison")
         
-        fig_scenarios = go.Figure()
-        
-        # Historical
-        fig_scenarios.add_trace(go.Scatter(
-            x=[2011, 2014, 2017, 2021, 2024],
-            y=[14, 22, 35, 46, 49],
-            name='Historical',
-            mode='lines+markers',
-            line=dict(color='#2c3e50', width=2),
-            marker=dict(size=8)
-        ))
-        
-        # All three scenarios
-        colors = {'Base Case': '#27ae60', 'Optimistic': '#3498db', 'Pessimistic': '#e74c3c'}
-        for scenario_name, data in scenarios.items():
-            fig_scenarios.add_trace(go.Scatter(
-                x=[2024, 2025, 2026, 2027],
-                y=[49, data['2025'], data['2026'], data['2027']],
-                name=scenario_name,
-                mode='lines+markers',
-                line=dict(color=colors[scenario_name], width=2, 
-                         dash='solid' if scenario_name == selected_scenario else 'dot'),
-                marker=dict(size=8 if scenario_name == selected_scenario else 6)
-            ))
-        
-        # Target line
-        fig_scenarios.add_hline(y=70, line_dash="dash", line_color="purple",
-                               annotation_text="NFIS-II Target (70%)")
-        
-        fig_scenarios.update_layout(
-            xaxis_title='Year',
-            yaxis_title='Account Ownership (%)',
-            yaxis_range=[0, 100],
-            height=500,
-            legend=dict(orientation='h', yanchor='bottom', y=1.02)
-        )
-        st.plotly_chart(fig_scenarios, use_container_width=True)
-        
-        st.markdown("---")
-        
-        # Consortium Key Questions
-        st.subheader("❓ Answers to Consortium's Key Questions")
-        
-        with st.expander("1. Will Ethiopia meet the NFIS-II target of 70% account ownership by 2025?", expanded=True):
-            st.markdown("""
-            **Answer: Very Unlikely** ❌
-            
-            - **Current (2024)**: 49%
-            - **2025 Forecast (Base)**: 61.8%
-            - **Gap to Target**: ~8pp
-            
-            Even in the optimistic scenario (64.4%), Ethiopia falls short of the 70% target. 
-            The target may be reached by **2026** in base/optimistic scenarios.
-            """)
-        
-        with st.expander("2. What events will have the largest impact on financial inclusion?"):
-            st.markdown("""
-            **Top 5 High-Impact Events:**
-            
-            | Rank | Event | ACCESS Impact | USAGE Impact | Confidence |
-            |------|-------|--------------|--------------|------------|
-            | 1 | Interoperability Full Launch (2026) | +4pp | +16pp | Low |
-            | 2 | EthioPay Instant Payment (2025) | +3pp | +15pp | Low |
-            | 3 | Telebirr Continued Growth | +6pp | +9pp | Medium |
-            | 4 | Fayda Digital ID Rollout | +6pp | +2pp | Low |
-            | 5 | M-Pesa Market Penetration | +3pp | +6pp | Medium |
-            
-            **Key Insight**: Interoperability and instant payment infrastructure have the highest 
-            potential impact on USAGE, while Telebirr and Digital ID drive ACCESS growth.
-            """)
-        
-        with st.expander("3. What are the key risks and uncertainties?"):
-            st.markdown("""
-            **Key Uncertainties:**
-            
-            1. **Data Sparsity**: Only 5 Findex data points over 13 years; CI width of ±21pp
-            2. **Event Execution**: Interoperability & EthioPay timing uncertain; could shift forecasts by ±5pp
-            3. **Macro Headwinds**: FX volatility, inflation may slow adoption
-            4. **Survey vs Admin Gap**: Mobile money registrations ≠ Findex ownership (4x gap observed)
-            5. **Gender Gap**: Women's adoption trajectory could drag overall rates
-            
-            **Confidence Assessment:**
-            - ACCESS forecast: **MEDIUM** confidence (historical trend well-established)
-            - USAGE forecast: **LOW** confidence (sparse data, proxy-based estimates)
-            - Event effects: **LOW-MEDIUM** confidence (based on comparable countries)
-            """)
-        
-        with st.expander("4. What is the P2P/ATM crossover significance?"):
-            st.markdown("""
-            **Historic Milestone: P2P > ATM in FY2024/25** 🎉
-            
-            - **P2P Transactions**: 128.3M (+158% YoY)
-            - **ATM Transactions**: 119.3M (+26% YoY)
-            - **Crossover Ratio**: 1.08x
-            
-            **Significance:**
-            - First time digital P2P transfers exceed ATM cash withdrawals in Ethiopia
-            - Indicates behavioral shift from cash to digital payments
-            - Validates mobile money adoption success
-            - Suggests USAGE indicators may grow faster than ACCESS
-            """)
-        
-        # Download full report
-        st.markdown("---")
-        st.subheader("📥 Download Reports")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Download forecast data
-            csv_fc = forecast_data.to_csv(index=False)
-            st.download_button(
-                label="📊 Download Forecast Data",
-                data=csv_fc,
-                file_name="ethiopia_fi_forecasts.csv",
-                mime="text/csv"
-            )
-        
-        with col2:
-            # Download impact matrix
-            csv_impact = impact_matrix.to_csv(index=False)
-            st.download_button(
-                label="📈 Download Impact Matrix",
-                data=csv_impact,
-                file_name="event_impact_matrix.csv",
-                mime="text/csv"
+        # Pre-rendered once per scenario, which skips Streamlit's
+        # per-rerun figure serialization
+        components.html(scenario_comparison_html(selected_scenario), height=520)
+    
+    render_scenario_projection()
+    
+    st.markdown("---")
+    
+    # Consortium Key Questions
+    st.subheader("❓ Answers to Consortium's Key Questions")
+    
+    tabs = st.tabs([key_question.label for key_question in KEY_QUESTIONS])
+    for tab, key_question in zip(tabs, KEY_QUESTIONS):
+        with tab:
+            st.markdown(
+                f"<p><strong>{key_question.question}</strong></p>{key_question.answer_html}",
+                unsafe_allow_html=True
             )
+    
+    # Download full report
+    st.markdown("---")
+    st.subheader("📥 Download Reports")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Download forecast data
+        st.download_button(
+            label="📊 Download Forecast Data",
+            data=dataset_csv_bytes('forecast_2025_2027'),
+            file_name="ethiopia_fi_forecasts.csv",
+            mime="text/csv"
+        )
+    
+    with col2:
+        # Download impact matrix
+        st.download_button(
+            label="📈 Download Impact Matrix",
+            data=dataset_csv_bytes('event_indicator_matrix_refined'),
+            file_name="event_impact_matrix.csv",
+            mime="text/csv"
+        )
 
 # Footer
-st.markdown("---")
-st.markdown(
-    "<div style='text-align: center; color: gray;'>"
-    "Ethiopia Financial Inclusion Forecasting Dashboard | Selam Analytics | February 2026"
-    "</div>",
-    unsafe_allow_html=True
-)
+render_footer()
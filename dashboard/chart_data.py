@@ -0,0 +1,207 @@
+"""
+Static Chart Data
+Selam Analytics - Forecasting Financial Inclusion
+
+Literal datasets behind the dashboard's charts. Streamlit re-executes
+app.py on every rerun, but imported modules are cached in sys.modules,
+so these frames are built once per process.
+"""
+
+from types import MappingProxyType
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+# P2P vs ATM transactions (FY2024/25)
+TRANSACTION_DATA = pd.DataFrame({
+    'Channel': ['P2P Digital', 'ATM Withdrawals'],
+    'Transactions (M)': [128.3, 119.3],
+    'YoY Growth': ['+158%', '+26%']
+})
+
+# Account ownership trajectory
+ACC_DATA = pd.DataFrame({
+    'Year': [2011, 2014, 2017, 2021, 2024],
+    'Account Ownership (%)': [14, 22, 35, 46, 49]
+})
+
+# Mobile money user growth
+MM_DATA = pd.DataFrame({
+    'Provider': ['Telebirr', 'M-Pesa', 'CBE Birr'],
+    'Users (M)': [54.8, 10.8, 2.5],
+    'Launch Year': [2021, 2023, 2017]
+})
+
+# Infrastructure growth
+INFRA_DATA = pd.DataFrame({
+    'Year': ['2023', '2025'],
+    '4G Coverage (%)': [37.5, 70.8],
+    'Smartphone Penetration (%)': [20, 24]
+})
+
+# Account ownership by gender
+GENDER_DATA = pd.DataFrame({
+    'Year': [2017, 2021, 2024],
+    'Male': [40, 56, 58],
+    'Female': [30, 36, 38],
+    'Gap': [10, 20, 20]
+})
+
+# Forecast data
+ACC_FORECAST = pd.DataFrame({
+    'Year': [2024, 2025, 2026, 2027],
+    'Account Ownership (%)': [49.0, 61.8, 73.7, 82.5],
+    'Trend Only': [49.0, 54.8, 57.7, 60.5],
+    'CI Lower': [49.0, 42.9, 53.9, 61.9],
+    'CI Upper': [49.0, 80.8, 93.4, 103.1],
+    'Pessimistic': [49.0, 57.8, 64.7, 70.0],
+    'Optimistic': [49.0, 64.4, 79.5, 90.6]
+})
+
+DP_FORECAST = pd.DataFrame({
+    'Year': [2024, 2025, 2026, 2027],
+    'Digital Payment (%)': [42.0, 59.6, 82.9, 100.0],  # Capped at 100
+    'Trend Only': [42.0, 48.6, 52.9, 57.3],
+    'CI Lower': [42.0, 35.8, 59.1, 79.1],
+    'CI Upper': [42.0, 83.4, 100.0, 100.0],  # Capped
+    'Pessimistic': [42.0, 53.3, 66.4, 79.1],
+    'Optimistic': [42.0, 63.6, 93.4, 100.0]  # Capped
+})
+
+FORECAST_SUMMARY = pd.DataFrame({
+    'Year': [2025, 2026, 2027],
+    'Account Ownership (Base)': ['61.8%', '73.7%', '82.5%'],
+    'ACC Range': ['57.8% - 64.4%', '64.7% - 79.5%', '70.0% - 90.6%'],
+    'Digital Payment (Base)': ['59.6%', '82.9%', '100.0%'],
+    'DP Range': ['53.3% - 63.6%', '66.4% - 93.4%', '79.1% - 100%']
+})
+
+# Account ownership scenarios. SCENARIO_VALUES holds one row per
+# scenario, one column per projected year; each Scenario's values field
+# is a view of its row. The 2024 starting point is the last ACC_DATA row.
+SCENARIO_YEARS = np.array([2025, 2026, 2027], dtype=np.float32)
+SCENARIO_VALUES = np.array([
+    [61.8, 73.7, 82.5],
+    [64.4, 79.5, 90.6],
+    [57.8, 64.7, 70.0],
+], dtype=np.float32)
+# Read-only, like the lookups below: every session shares these arrays,
+# and each Scenario's values view inherits the flag
+SCENARIO_YEARS.flags.writeable = False
+SCENARIO_VALUES.flags.writeable = False
+
+
+class Scenario(NamedTuple):
+    """One account ownership projection scenario"""
+    name: str
+    # A float32 row view rather than a tuple, so charts get compact arrays;
+    # this makes a Scenario unhashable, so cached builders take the name
+    values: np.ndarray
+    color: str
+    description: str
+
+
+SCENARIOS = (
+    Scenario('Base Case', SCENARIO_VALUES[0], '#27ae60',
+             'Expected event effects materialize as planned'),
+    Scenario('Optimistic', SCENARIO_VALUES[1], '#3498db',
+             'Strong execution, synergies realized, accelerated adoption'),
+    Scenario('Pessimistic', SCENARIO_VALUES[2], '#e74c3c',
+             'Economic headwinds, slower adoption, infrastructure delays'),
+)
+# Lookups are read-only views, since every session shares this module
+SCENARIO_BY_NAME = MappingProxyType({scenario.name: scenario for scenario in SCENARIOS})
+
+# 2025 gauge bar colour per scenario: green at 60% or above, red below
+GAUGE_BAR = MappingProxyType({
+    scenario.name: '#27ae60' if scenario.values[0] >= 60 else '#e74c3c'
+    for scenario in SCENARIOS
+})
+
+
+class KeyQuestion(NamedTuple):
+    """One of the consortium's key questions and its answer"""
+    label: str
+    question: str
+    answer_html: str
+
+
+# The consortium's key questions; answers are written as HTML so they are
+# handed to st.markdown as-is rather than converted from markdown
+KEY_QUESTIONS = (
+    KeyQuestion(
+        "1. 70% Target",
+        "Will Ethiopia meet the NFIS-II target of 70% account ownership by 2025?",
+        """
+<p><strong>Answer: Very Unlikely</strong> ❌</p>
+<ul>
+<li><strong>Current (2024)</strong>: 49%</li>
+<li><strong>2025 Forecast (Base)</strong>: 61.8%</li>
+<li><strong>Gap to Target</strong>: ~8pp</li>
+</ul>
+<p>Even in the optimistic scenario (64.4%), Ethiopia falls short of the 70% target.
+The target may be reached by <strong>2026</strong> in base/optimistic scenarios.</p>
+""",
+    ),
+    KeyQuestion(
+        "2. Largest Impact",
+        "What events will have the largest impact on financial inclusion?",
+        """
+<p><strong>Top 5 High-Impact Events:</strong></p>
+<table>
+<thead>
+<tr><th>Rank</th><th>Event</th><th>ACCESS Impact</th><th>USAGE Impact</th><th>Confidence</th></tr>
+</thead>
+<tbody>
+<tr><td>1</td><td>Interoperability Full Launch (2026)</td><td>+4pp</td><td>+16pp</td><td>Low</td></tr>
+<tr><td>2</td><td>EthioPay Instant Payment (2025)</td><td>+3pp</td><td>+15pp</td><td>Low</td></tr>
+<tr><td>3</td><td>Telebirr Continued Growth</td><td>+6pp</td><td>+9pp</td><td>Medium</td></tr>
+<tr><td>4</td><td>Fayda Digital ID Rollout</td><td>+6pp</td><td>+2pp</td><td>Low</td></tr>
+<tr><td>5</td><td>M-Pesa Market Penetration</td><td>+3pp</td><td>+6pp</td><td>Medium</td></tr>
+</tbody>
+</table>
+<p><strong>Key Insight</strong>: Interoperability and instant payment infrastructure have the highest
+potential impact on USAGE, while Telebirr and Digital ID drive ACCESS growth.</p>
+""",
+    ),
+    KeyQuestion(
+        "3. Risks",
+        "What are the key risks and uncertainties?",
+        """
+<p><strong>Key Uncertainties:</strong></p>
+<ol>
+<li><strong>Data Sparsity</strong>: Only 5 Findex data points over 13 years; CI width of ±21pp</li>
+<li><strong>Event Execution</strong>: Interoperability &amp; EthioPay timing uncertain; could shift forecasts by ±5pp</li>
+<li><strong>Macro Headwinds</strong>: FX volatility, inflation may slow adoption</li>
+<li><strong>Survey vs Admin Gap</strong>: Mobile money registrations ≠ Findex ownership (4x gap observed)</li>
+<li><strong>Gender Gap</strong>: Women's adoption trajectory could drag overall rates</li>
+</ol>
+<p><strong>Confidence Assessment:</strong></p>
+<ul>
+<li>ACCESS forecast: <strong>MEDIUM</strong> confidence (historical trend well-established)</li>
+<li>USAGE forecast: <strong>LOW</strong> confidence (sparse data, proxy-based estimates)</li>
+<li>Event effects: <strong>LOW-MEDIUM</strong> confidence (based on comparable countries)</li>
+</ul>
+""",
+    ),
+    KeyQuestion(
+        "4. P2P/ATM Crossover",
+        "What is the P2P/ATM crossover significance?",
+        """
+<p><strong>Historic Milestone: P2P &gt; ATM in FY2024/25</strong> 🎉</p>
+<ul>
+<li><strong>P2P Transactions</strong>: 128.3M (+158% YoY)</li>
+<li><strong>ATM Transactions</strong>: 119.3M (+26% YoY)</li>
+<li><strong>Crossover Ratio</strong>: 1.08x</li>
+</ul>
+<p><strong>Significance:</strong></p>
+<ul>
+<li>First time digital P2P transfers exceed ATM cash withdrawals in Ethiopia</li>
+<li>Indicates behavioral shift from cash to digital payments</li>
+<li>Validates mobile money adoption success</li>
+<li>Suggests USAGE indicators may grow faster than ACCESS</li>
+</ul>
+""",
+    ),
+)
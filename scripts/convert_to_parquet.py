@@ -0,0 +1,129 @@
+"""
+Convert Processed Datasets to Parquet
+Selam Analytics - Forecasting Financial Inclusion
+
+One-time offline step that converts the dashboard's processed CSV inputs
+into Parquet so the dashboard can load them without re-parsing text.
+The unified dataset is also pre-split into observations and events with
+their `year` already parsed, plus the percentage-unit observations the
+Trends page charts, so the dashboard does no per-session work. A
+full-column copy of the observations backs the Trends page downloads.
+Run from the repository root after notebooks 01-04 have been executed:
+
+    python scripts/convert_to_parquet.py
+"""
+
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROCESSED_PATH = os.path.join(BASE_PATH, 'data/processed')
+
+DATASETS = [
+    'ethiopia_fi_unified_data_enriched',
+    'forecast_2025_2027',
+    'event_indicator_matrix_refined',
+]
+
+# Columns the dashboard reads from the unified dataset; low-cardinality
+# string columns it filters on are stored as categoricals, and
+# value_numeric is downcast to float32 for the chart partitions. The
+# observations download keeps every column of the source CSV at full
+# precision and in source row order.
+MAIN_COLUMNS = ['record_type', 'observation_date', 'indicator_code', 'gender', 'pillar', 'unit',
+                'value_numeric', 'indicator']
+MAIN_DTYPES = {
+    'record_type': 'category',
+    'indicator_code': 'category',
+    'gender': 'category',
+    'pillar': 'category',
+    'unit': 'category',
+    'indicator': 'category',
+}
+
+# Columns the dashboard reads from the observation and event partitions
+RECORD_COLUMNS = ['indicator_code', 'gender', 'pillar', 'unit', 'value_numeric', 'observation_date', 'indicator']
+
+
+def write_parquet(df, name):
+    """Write a DataFrame as zstd-compressed Parquet with dictionary-encoded columns"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(
+        table,
+        os.path.join(PROCESSED_PATH, f'{name}.parquet'),
+        compression='zstd',
+        use_dictionary=True
+    )
+    print(f"✅ Saved {name}.parquet ({len(df)} rows)")
+
+
+def parse_dates(dates):
+    """Parse observation dates with the vectorized parser
+    
+    Notebook 01 writes dates both as plain dates ('2024-11-29') and as
+    timestamps ('2024-11-29 00:00:00'), so each format is tried in turn.
+    """
+    parsed = pd.to_datetime(dates, format='%Y-%m-%d', errors='coerce')
+    return parsed.fillna(pd.to_datetime(dates, format='%Y-%m-%d %H:%M:%S', errors='coerce'))
+
+
+def check_parsed(raw, parsed, column):
+    """Fail if parsing turned any non-blank value into a missing one"""
+    present = raw.notna() & raw.astype('string').str.strip().ne('')
+    unparsed = present & parsed.isna()
+    if unparsed.any():
+        examples = raw[unparsed].astype('string').unique()[:5].tolist()
+        raise ValueError(f"{unparsed.sum()} {column} values could not be parsed, e.g. {examples}")
+
+
+def split_records(main_data):
+    """Split the unified dataset into full-column observations, observations and events with a typed year column"""
+    year = parse_dates(main_data['observation_date']).dt.year.astype('Int16')
+    record_type = main_data['record_type']
+    observations_full = main_data.loc[record_type.eq('observation')].assign(year=year)
+    # Only the chart partitions are narrowed, downcast and sorted
+    records = main_data[RECORD_COLUMNS].assign(
+        value_numeric=main_data['value_numeric'].astype('float32'),
+        year=year
+    )
+    observations = records.loc[record_type.eq('observation')].sort_values(['indicator_code', 'year'])
+    events = records.loc[record_type.eq('event')]
+    return observations_full, observations, events
+
+
+def percent_observations(observations):
+    """Percentage-unit observations charted on the Trends page"""
+    return observations[observations['unit'] == '%']
+
+
+def main():
+    for name in DATASETS:
+        csv_path = os.path.join(PROCESSED_PATH, f'{name}.csv')
+        
+        # The pyarrow engine parses with Arrow's multi-threaded C++ reader
+        if name == 'ethiopia_fi_unified_data_enriched':
+            # Categoricals are cast after reading: passing dtype= to the
+            # pyarrow engine fails on pandas 3 for sparse integer columns
+            # outside the map, such as lag_months
+            df = pd.read_csv(csv_path, engine='pyarrow').astype(MAIN_DTYPES)
+            values = pd.to_numeric(df['value_numeric'], errors='coerce')
+            check_parsed(df['value_numeric'], values, 'value_numeric')
+            df['value_numeric'] = values
+            check_parsed(df['observation_date'], parse_dates(df['observation_date']), 'observation_date')
+            observations_full, observations, events = split_records(df)
+            write_parquet(observations_full, 'observations_full')
+            write_parquet(observations, 'observations')
+            write_parquet(percent_observations(observations), 'observations_pct')
+            write_parquet(events, 'events')
+            df = df[MAIN_COLUMNS].assign(value_numeric=values.astype('float32'))
+        else:
+            df = pd.read_csv(csv_path, engine='pyarrow', dtype_backend='pyarrow')
+        
+        write_parquet(df, name)
+
+
+if __name__ == '__main__':
+    main()
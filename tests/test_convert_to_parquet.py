@@ -0,0 +1,126 @@
+"""
+Tests for scripts/convert_to_parquet.py ingest helpers
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+from convert_to_parquet import (  # noqa: E402
+    RECORD_COLUMNS, check_parsed, parse_dates, percent_observations, split_records
+)
+
+
+def make_main_data():
+    """Small unified dataset with both date formats, a blank date and unsorted observations"""
+    return pd.DataFrame({
+        'record_type': pd.Categorical(
+            ['observation', 'event', 'observation', 'observation', 'observation', 'event']
+        ),
+        'observation_date': [
+            '2024-11-29', '2021-05-01 00:00:00', '2014-12-31 00:00:00', '2021-06-30', None, '2025-01-15',
+        ],
+        'indicator_code': pd.Categorical(
+            ['USG_P2P', 'EVT_TELEBIRR', 'ACC_OWNERSHIP', 'ACC_OWNERSHIP', 'USG_P2P', 'EVT_FAYDA'],
+            categories=['USG_P2P', 'EVT_TELEBIRR', 'EVT_FAYDA', 'ACC_OWNERSHIP'],
+        ),
+        'gender': pd.Categorical(['all'] * 6),
+        'pillar': pd.Categorical(['USAGE', None, 'ACCESS', 'ACCESS', 'USAGE', None]),
+        'unit': pd.Categorical(['count', None, '%', '%', 'count', None]),
+        'value_numeric': [119312457.0, np.nan, 22.0, 46.0, 577700000000.0, np.nan],
+        'indicator': pd.Categorical(
+            ['P2P transactions', 'Telebirr launch', 'Account ownership', 'Account ownership',
+             'P2P transactions', 'Fayda rollout']
+        ),
+        'source_name': ['NBE', 'Ethio Telecom', 'Findex', 'Findex', 'NBE', 'NIDP'],
+    })
+
+
+def test_parse_dates_accepts_both_formats():
+    dates = pd.Series(['2024-11-29', '2024-11-29 00:00:00', '2021-06-30 12:30:00'])
+    parsed = parse_dates(dates)
+    assert parsed.tolist() == [
+        pd.Timestamp('2024-11-29'), pd.Timestamp('2024-11-29'), pd.Timestamp('2021-06-30 12:30:00'),
+    ]
+
+
+def test_parse_dates_leaves_blank_dates_missing():
+    parsed = parse_dates(pd.Series(['2024-11-29', None, '']))
+    assert parsed.isna().tolist() == [False, True, True]
+
+
+def test_check_parsed_allows_blank_values():
+    raw = pd.Series(['2024-11-29', None, ' '])
+    check_parsed(raw, parse_dates(raw), 'observation_date')
+
+
+def test_check_parsed_rejects_unparsed_dates():
+    raw = pd.Series(['2024-11-29', '29/11/2024'])
+    with pytest.raises(ValueError, match='1 observation_date values'):
+        check_parsed(raw, parse_dates(raw), 'observation_date')
+
+
+def test_check_parsed_rejects_unparsed_values():
+    raw = pd.Series(['49.0', 'n/a', ''])
+    with pytest.raises(ValueError, match='1 value_numeric values'):
+        check_parsed(raw, pd.to_numeric(raw, errors='coerce'), 'value_numeric')
+
+
+def test_split_records_separates_observations_and_events():
+    observations_full, observations, events = split_records(make_main_data())
+    assert len(observations_full) == len(observations) == 4
+    assert len(events) == 2
+    assert set(events['indicator_code']) == {'EVT_TELEBIRR', 'EVT_FAYDA'}
+    assert list(observations.columns) == RECORD_COLUMNS + ['year']
+    assert list(events.columns) == RECORD_COLUMNS + ['year']
+
+
+def test_split_records_keeps_every_column_in_full_observations():
+    observations_full, observations, _ = split_records(make_main_data())
+    assert 'source_name' in observations_full.columns
+    assert 'source_name' not in observations.columns
+    # The download keeps source row order; only the chart partition is sorted
+    assert observations_full.index.tolist() == [0, 2, 3, 4]
+    assert sorted(observations.index) == observations_full.index.tolist()
+
+
+def test_split_records_downcasts_only_chart_partitions():
+    observations_full, observations, events = split_records(make_main_data())
+    assert observations_full['value_numeric'].dtype == np.float64
+    assert observations_full['value_numeric'].tolist()[0] == 119312457.0
+    assert observations_full['value_numeric'].tolist()[-1] == 577700000000.0
+    assert observations['value_numeric'].dtype == np.float32
+    assert events['value_numeric'].dtype == np.float32
+
+
+def test_split_records_year_is_nullable_int16():
+    observations_full, observations, events = split_records(make_main_data())
+    for frame in (observations_full, observations, events):
+        assert frame['year'].dtype == 'Int16'
+    assert events['year'].tolist() == [2021, 2025]
+    # The blank date leaves its year missing rather than dropping the row
+    assert observations['year'].isna().sum() == 1
+
+
+def test_split_records_sorts_observations_by_indicator_and_year():
+    _, observations, _ = split_records(make_main_data())
+    # compute_trend_data groups with sort=False, so each indicator's rows
+    # must be contiguous and in year order
+    codes = observations['indicator_code'].astype(str).tolist()
+    assert codes == sorted(codes, key=codes.index)
+    for _, group in observations.groupby('indicator_code', observed=True):
+        assert group['year'].dropna().is_monotonic_increasing
+    assert observations.loc[observations['indicator_code'] == 'ACC_OWNERSHIP', 'year'].tolist() == [2014, 2021]
+
+
+def test_percent_observations_keeps_only_percentage_units():
+    _, observations, _ = split_records(make_main_data())
+    observations_pct = percent_observations(observations)
+    assert len(observations_pct) == 2
+    assert (observations_pct['unit'] == '%').all()
+    assert observations_pct['year'].tolist() == [2014, 2021]